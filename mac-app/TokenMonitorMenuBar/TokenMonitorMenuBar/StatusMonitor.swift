@@ -25,7 +25,54 @@ final class StatusMonitor {
         return ("~/github/token-monitoring/capture-status.py" as NSString).expandingTildeInPath
     }
 
-    func fetchStatus(completion: @escaping (StatusResult) -> Void) {
+    /// Seconds before a scheduled refresh to boot a warm `claude` session (nil = disabled).
+    var prewarmLead: TimeInterval? {
+        guard
+            let value = ProcessInfo.processInfo.environment["TOKEN_MONITOR_PREWARM_LEAD"],
+            let seconds = TimeInterval(value),
+            seconds > 0
+        else {
+            return nil
+        }
+        return seconds
+    }
+
+    private var warmSocketPath: String {
+        (NSTemporaryDirectory() as NSString).appendingPathComponent("token-monitor-warm.sock")
+    }
+
+    private func captureEnvironment() -> [String: String] {
+        // Pass through essential environment variables
+        var env = ProcessInfo.processInfo.environment
+        env["PATH"] = "/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin"
+        env["HOME"] = FileManager.default.homeDirectoryForCurrentUser.path
+        env["TERM"] = "xterm-256color"
+        // 이미 승인된 폴더를 cwd로 사용 (홈 디렉토리는 매번 확인 프롬프트 발생)
+        env["CLAUDE_CWD"] = FileManager.default.temporaryDirectory.path
+        return env
+    }
+
+    /// Boots a background `claude` session that the next capture picks up over `warmSocketPath`.
+    /// The script detaches immediately and tears the session down if it goes unused.
+    func prewarm(idleTimeout: TimeInterval) {
+        let process = Process()
+        process.launchPath = "/usr/bin/python3"
+        process.currentDirectoryURL = FileManager.default.homeDirectoryForCurrentUser
+        process.arguments = [scriptPath, "--prewarm", "--warm-socket", warmSocketPath, "--idle-timeout", String(Int(idleTimeout))]
+        process.environment = captureEnvironment()
+        process.standardOutput = FileHandle.nullDevice
+        process.standardError = FileHandle.nullDevice
+        do {
+            AppLogger.log("Pre-warming claude session (idle timeout \(Int(idleTimeout))s)")
+            try process.run()
+        } catch {
+            AppLogger.log("Failed to pre-warm session: \(error.localizedDescription)")
+        }
+    }
+
+    /// `useWarmSession` should only be set for scheduled refreshes, so a manual refresh
+    /// does not take the session pre-warmed for the upcoming scheduled capture.
+    func fetchStatus(useWarmSession: Bool = false, completion: @escaping (StatusResult) -> Void) {
         stateQueue.async { [weak self] in
             guard let self = self else { return }
             self.pendingCompletions.append(completion)
@@ -34,11 +81,11 @@ final class StatusMonitor {
                 return
             }
             self.isRunning = true
-            self.runCapture(attempt: 1)
+            self.runCapture(attempt: 1, useWarmSession: useWarmSession)
         }
     }
 
-    private func runCapture(attempt: Int) {
+    private func runCapture(attempt: Int, useWarmSession: Bool) {
         let process = Process()
         process.launchPath = "/usr/bin/python3"
         // 홈 디렉토리에서 실행 (앱 번들 Resources는 읽기 전용)
@@ -47,16 +94,14 @@ final class StatusMonitor {
         if let rawPath = ProcessInfo.processInfo.environment["TOKEN_MONITOR_CAPTURE_RAW"], !rawPath.isEmpty {
             arguments += ["--raw", rawPath]
         }
+        if let archivePath = ProcessInfo.processInfo.environment["TOKEN_MONITOR_CAPTURE_RAW_ARCHIVE"], !archivePath.isEmpty {
+            arguments += ["--raw-archive", archivePath]
+        }
+        if useWarmSession && prewarmLead != nil {
+            arguments += ["--warm-socket", warmSocketPath]
+        }
         process.arguments = arguments
-
-        // Pass through essential environment variables
-        var env = ProcessInfo.processInfo.environment
-        env["PATH"] = "/opt/homebrew/bin:/usr/local/bin:/usr/bin:/bin:/usr/sbin:/sbin"
-        env["HOME"] = FileManager.default.homeDirectoryForCurrentUser.path
-        env["TERM"] = "xterm-256color"
-        // 이미 승인된 폴더를 cwd로 사용 (홈 디렉토리는 매번 확인 프롬프트 발생)
-        env["CLAUDE_CWD"] = FileManager.default.temporaryDirectory.path
-        process.environment = env
+        process.environment = captureEnvironment()
 
         let pipe = Pipe()
         process.standardOutput = pipe
@@ -80,7 +125,8 @@ final class StatusMonitor {
             if result == nil && attempt < 2 {
                 AppLogger.log("Capture parse failed; retrying (attempt \(attempt + 1))")
                 DispatchQueue.global().asyncAfter(deadline: .now() + 2) {
-                    self.runCapture(attempt: attempt + 1)
+                    // 워밍 세션은 첫 시도에서 소비되었으므로 재시도는 콜드 실행
+                    self.runCapture(attempt: attempt + 1, useWarmSession: false)
                 }
                 return
             }
@@ -5,6 +5,8 @@ final class TokenMonitorMenuBarApp: NSObject, NSApplicationDelegate {
     private var statusItem: NSStatusItem!
     private var timer: Timer?
     private var countdownTimer: Timer?
+    private var prewarmTimer: Timer?
+    private let prewarmIdleGrace: TimeInterval = 30
     private let monitor = StatusMonitor()
     private let refreshIntervalKey = "refreshIntervalSeconds"
     private let refreshOptions: [(title: String, seconds: TimeInterval)] = [
@@ -57,9 +59,17 @@ final class TokenMonitorMenuBarApp: NSObject, NSApplicationDelegate {
     }
 
     @objc private func refreshNow() {
+        refresh(useWarmSession: false)
+    }
+
+    @objc private func scheduledRefresh() {
+        refresh(useWarmSession: true)
+    }
+
+    private func refresh(useWarmSession: Bool) {
         ensureStatusItem()
         AppLogger.log("Refreshing status")
-        monitor.fetchStatus { [weak self] result in
+        monitor.fetchStatus(useWarmSession: useWarmSession) { [weak self] result in
             DispatchQueue.main.async {
                 self?.lastStatus = result
                 let title = self?.currentMenuTitle() ?? "CC ..."
@@ -70,6 +80,7 @@ final class TokenMonitorMenuBarApp: NSObject, NSApplicationDelegate {
                 self?.statusItem.button?.title = title
             }
         }
+        schedulePrewarm()
     }
 
     @objc private func selectRefreshInterval(_ sender: NSMenuItem) {
@@ -81,8 +92,30 @@ final class TokenMonitorMenuBarApp: NSObject, NSApplicationDelegate {
 
     private func rescheduleTimer() {
         timer?.invalidate()
-        timer = Timer.scheduledTimer(timeInterval: currentRefreshInterval(), target: self, selector: #selector(refreshNow), userInfo: nil, repeats: true)
+        timer = Timer.scheduledTimer(timeInterval: currentRefreshInterval(), target: self, selector: #selector(scheduledRefresh), userInfo: nil, repeats: true)
         AppLogger.log("Refresh interval set to \(Int(currentRefreshInterval()))s")
+        schedulePrewarm()
+    }
+
+    private func schedulePrewarm() {
+        prewarmTimer?.invalidate()
+        prewarmTimer = nil
+        guard let lead = monitor.prewarmLead, let refreshTimer = timer, refreshTimer.isValid else {
+            return
+        }
+        // 반복 타이머의 fireDate가 아직 갱신되지 않았을 수 있으므로 다음 주기로 보정
+        var nextRefresh = refreshTimer.fireDate
+        let interval = currentRefreshInterval()
+        while nextRefresh.timeIntervalSinceNow <= lead {
+            nextRefresh = nextRefresh.addingTimeInterval(interval)
+        }
+        let fireDate = nextRefresh.addingTimeInterval(-lead)
+        let idleTimeout = lead + prewarmIdleGrace
+        let warmTimer = Timer(fire: fireDate, interval: 0, repeats: false) { [weak self] _ in
+            self?.monitor.prewarm(idleTimeout: idleTimeout)
+        }
+        RunLoop.main.add(warmTimer, forMode: .common)
+        prewarmTimer = warmTimer
     }
 
     private func rescheduleCountdownTimer() {
@@ -8,11 +8,24 @@ import select
 import fcntl
 import struct
 import signal
+import socket
 import subprocess
 import sys
 import time
 import json
-from typing import Optional, Tuple
+import zlib
+from typing import List, Optional, Tuple
+
+
+ARCHIVE_DICT_NAME = "dict.bin"
+ARCHIVE_DATA_NAME = "captures.bin"
+ARCHIVE_INDEX_NAME = "index.jsonl"
+# zlib 프리셋 사전은 윈도우 크기(32KB)까지만 유효
+ARCHIVE_DICT_MAX = 32 * 1024
+
+# drive_capture 강제 종료 시간 / 워밍 세션 부팅 제한 시간 (초)
+CAPTURE_HARD_TIMEOUT = 75.0
+WARM_BOOT_TIMEOUT = 30.0
 
 
 def strip_ansi(text: str) -> str:
@@ -53,11 +66,152 @@ def find_claude() -> str:
     return "claude"
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser()
-    parser.add_argument("--json", action="store_true", help="output JSON summary")
-    parser.add_argument("--raw", type=str, help="write raw output to file")
-    args = parser.parse_args()
+def archive_dict_id(zdict: bytes) -> str:
+    return "%08x" % zlib.crc32(zdict)
+
+
+def archive_capture(archive_dir: str, clean: str, captured_at: str, outcome: str) -> None:
+    """Append one compressed raw capture to the archive and record it in the index.
+
+    Captures are deflated against a shared preset dictionary (the tail of the
+    first non-empty `ok` capture), so near-identical TUI screens compress to a
+    few hundred bytes. Until such a capture exists, captures are stored
+    without a dictionary. The index is one JSON line per capture with its
+    timestamp, parse outcome, byte range in the data file and the id of the
+    dictionary it was compressed with (null for none).
+    """
+    os.makedirs(archive_dir, exist_ok=True)
+    data = clean.encode("utf-8")
+    dict_path = os.path.join(archive_dir, ARCHIVE_DICT_NAME)
+    index_path = os.path.join(archive_dir, ARCHIVE_INDEX_NAME)
+    with open(index_path, "a", encoding="utf-8") as index_file:
+        # 동시 실행 시 data/index 오프셋이 꼬이지 않도록 index 파일로 잠금
+        fcntl.flock(index_file, fcntl.LOCK_EX)
+        try:
+            # 빈 캡처나 파싱 실패 캡처로 사전을 고정하지 않도록 정상 캡처로만 생성
+            if not os.path.exists(dict_path) and outcome == "ok" and data.strip():
+                with open(dict_path, "wb") as f:
+                    f.write(data[-ARCHIVE_DICT_MAX:])
+            zdict = b""
+            try:
+                with open(dict_path, "rb") as f:
+                    zdict = f.read()
+            except OSError:
+                pass
+            compressor = zlib.compressobj(level=9, zdict=zdict) if zdict else zlib.compressobj(level=9)
+            blob = compressor.compress(data) + compressor.flush()
+            with open(os.path.join(archive_dir, ARCHIVE_DATA_NAME), "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(blob)
+            entry = {
+                "captured_at": captured_at,
+                "outcome": outcome,
+                "offset": offset,
+                "length": len(blob),
+                "size": len(data),
+                "dict": archive_dict_id(zdict) if zdict else None,
+            }
+            index_file.write(json.dumps(entry, ensure_ascii=True) + "\n")
+            index_file.flush()
+        finally:
+            fcntl.flock(index_file, fcntl.LOCK_UN)
+
+
+def valid_archive_entry(entry: dict) -> bool:
+    """True if an index entry has the fields extraction needs."""
+    return (
+        isinstance(entry.get("captured_at"), str)
+        and isinstance(entry.get("outcome"), str)
+        and isinstance(entry.get("offset"), int)
+        and isinstance(entry.get("length"), int)
+        and entry["offset"] >= 0
+        and entry["length"] >= 0
+    )
+
+
+def read_archive_index(archive_dir: str, outcome: Optional[str] = None) -> List[dict]:
+    """Return index entries, optionally filtered by parse outcome."""
+    entries = []
+    try:
+        with open(os.path.join(archive_dir, ARCHIVE_INDEX_NAME), encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(entry, dict):
+                    continue
+                if outcome is None or entry.get("outcome") == outcome:
+                    entries.append(entry)
+    except OSError:
+        pass
+    return entries
+
+
+def extract_archive(archive_dir: str, out_dir: str, outcome: Optional[str] = None) -> Tuple[int, int]:
+    """Decompress matching captures into `out_dir`, one file per capture.
+
+    Only the indexed byte ranges are read, so pulling the `parse_failed`
+    captures does not touch the rest of the archive. Captures with an
+    incomplete index entry, a missing or mismatched dictionary, or a
+    truncated/corrupt stream (checked against the indexed `length` and
+    `size`) are skipped. Returns (files written, captures skipped).
+    """
+    entries = read_archive_index(archive_dir, outcome)
+    if not entries:
+        return 0, 0
+    zdict = b""
+    try:
+        with open(os.path.join(archive_dir, ARCHIVE_DICT_NAME), "rb") as f:
+            zdict = f.read()
+    except OSError:
+        pass
+    dict_id = archive_dict_id(zdict) if zdict else None
+    try:
+        data_file = open(os.path.join(archive_dir, ARCHIVE_DATA_NAME), "rb")
+    except OSError:
+        return 0, len(entries)
+    os.makedirs(out_dir, exist_ok=True)
+    written = 0
+    skipped = 0
+    with data_file:
+        for entry in entries:
+            if not valid_archive_entry(entry):
+                skipped += 1
+                continue
+            entry_dict = entry.get("dict")
+            if entry_dict and entry_dict != dict_id:
+                skipped += 1
+                continue
+            data_file.seek(entry["offset"])
+            blob = data_file.read(entry["length"])
+            if len(blob) != entry["length"]:
+                skipped += 1
+                continue
+            decompressor = zlib.decompressobj(zdict=zdict) if entry_dict else zlib.decompressobj()
+            try:
+                data = decompressor.decompress(blob) + decompressor.flush()
+            except zlib.error:
+                skipped += 1
+                continue
+            # 잘린 스트림은 예외 없이 부분 데이터를 돌려주므로 직접 확인
+            if not decompressor.eof or ("size" in entry and len(data) != entry["size"]):
+                skipped += 1
+                continue
+            text = data.decode("utf-8", errors="ignore")
+            stamp = entry["captured_at"].replace(":", "")
+            name = f"{stamp}-{entry['offset']}-{entry['outcome']}.txt"
+            with open(os.path.join(out_dir, name), "w", encoding="utf-8") as f:
+                f.write(text)
+            written += 1
+    return written, skipped
+
+
+def spawn_claude() -> Tuple[int, subprocess.Popen]:
+    """Start `claude` attached to a fresh PTY and return (master_fd, proc)."""
     master_fd, slave_fd = pty.openpty()
     # Set a default terminal size to ensure TUI renders.
     try:
@@ -78,16 +232,33 @@ def main() -> int:
         cwd=cwd,
     )
     os.close(slave_fd)
+    return master_fd, proc
+
+
+def close_claude(master_fd: int, proc: subprocess.Popen) -> None:
+    try:
+        os.close(master_fd)
+    except OSError:
+        pass
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+
 
-    output = []
+def drive_capture(master_fd: int, proc: subprocess.Popen, output: List[bytes], ready: bool = False) -> None:
+    """Drive `claude` through `/status` to the Usage view, appending PTY output.
+
+    With `ready`, the session is already at the `❯` prompt (see `boot_session`),
+    so `/status` is sent immediately instead of after the boot settle delay.
+    """
     start = time.time()
+    settle = 0.0 if ready else 3.0
     sent_status = False
     sent_exit = False
     sent_tabs = 0
     last_tab_time = 0.0
     saw_settings = False
     saw_usage = False
-    saw_prompt = False
+    saw_prompt = ready
     saw_status_hint = False
     saw_stats_hint = False
     sent_status_text = False
@@ -105,115 +276,266 @@ def main() -> int:
     saw_usage_at = 0.0
     saw_reset_line = False
 
-    try:
-        def send_command(cmd: bytes) -> None:
-            os.write(master_fd, b"/" + cmd)
-            time.sleep(0.4)
-            os.write(master_fd, b"\r")
-            time.sleep(0.4)
-            os.write(master_fd, b"\r")
+    def send_command(cmd: bytes) -> None:
+        os.write(master_fd, b"/" + cmd)
+        time.sleep(0.4)
+        os.write(master_fd, b"\r")
+        time.sleep(0.4)
+        os.write(master_fd, b"\r")
+
+    while True:
+        now = time.time()
+
+        # "Do you want to work in this folder?" 프롬프트 자동 승인
+        if saw_folder_confirm and folder_confirm_first_seen == 0.0:
+            folder_confirm_first_seen = now
+        if saw_folder_confirm and (not sent_folder_confirm or (now - sent_folder_confirm_at > 2.0)) and folder_confirm_attempts < 3:
+            time.sleep(0.3)
+            os.write(master_fd, b"\r")  # Enter로 "Yes, continue" 선택
+            sent_folder_confirm = True
+            sent_folder_confirm_at = now
+            folder_confirm_attempts += 1
+            if folder_confirm_attempts == 1:
+                start = time.time()  # 타이머 리셋
+        if saw_folder_confirm and folder_confirm_first_seen and now - folder_confirm_first_seen > 10:
+            break
+
+        if not sent_usage_text and saw_prompt and now - start > settle:
+            send_command(b"status")
+            sent_usage_text = True
+            usage_text_at = now
+            sent_status = True
+            status_sent_at = now
+            usage_sent_at = now
+
+        if sent_status and not saw_usage and now - last_tab_time > 1.5:
+            if saw_settings or (status_sent_at and now - status_sent_at > 8):
+                os.write(master_fd, b"\t")
+                sent_tabs += 1
+                last_tab_time = now
+                time.sleep(0.3)
 
-        while True:
-            now = time.time()
+        if sent_status and not saw_usage and (usage_sent_at and now - usage_sent_at > 8) and not sent_stats:
+            send_command(b"stats")
+            sent_stats = True
+            usage_sent_at = now
 
-            # "Do you want to work in this folder?" 프롬프트 자동 승인
-            if saw_folder_confirm and folder_confirm_first_seen == 0.0:
-                folder_confirm_first_seen = now
-            if saw_folder_confirm and (not sent_folder_confirm or (now - sent_folder_confirm_at > 2.0)) and folder_confirm_attempts < 3:
-                time.sleep(0.3)
-                os.write(master_fd, b"\r")  # Enter로 "Yes, continue" 선택
-                sent_folder_confirm = True
-                sent_folder_confirm_at = now
-                folder_confirm_attempts += 1
-                if folder_confirm_attempts == 1:
-                    start = time.time()  # 타이머 리셋
-            if saw_folder_confirm and folder_confirm_first_seen and now - folder_confirm_first_seen > 10:
-                break
+        if sent_status and saw_usage and not sent_exit and (saw_reset_line or (saw_usage_at and now - saw_usage_at > 2.0)):
+            os.write(master_fd, b"/exit\r")
+            sent_exit = True
+
+        if not sent_exit and now - start > 60:
+            os.write(master_fd, b"/exit\r")
+            sent_exit = True
 
-            if not sent_usage_text and saw_prompt and now - start > 3:
-                send_command(b"status")
-                sent_usage_text = True
-                usage_text_at = now
-                sent_status = True
-                status_sent_at = now
-                usage_sent_at = now
-
-            if sent_status and not saw_usage and now - last_tab_time > 1.5:
-                if saw_settings or (status_sent_at and now - status_sent_at > 8):
-                    os.write(master_fd, b"\t")
-                    sent_tabs += 1
-                    last_tab_time = now
-                    time.sleep(0.3)
-
-            if sent_status and not saw_usage and (usage_sent_at and now - usage_sent_at > 8) and not sent_stats:
-                send_command(b"stats")
-                sent_stats = True
-                usage_sent_at = now
-
-            if sent_status and saw_usage and not sent_exit and (saw_reset_line or (saw_usage_at and now - saw_usage_at > 2.0)):
-                os.write(master_fd, b"/exit\r")
-                sent_exit = True
-
-            if not sent_exit and now - start > 60:
-                os.write(master_fd, b"/exit\r")
-                sent_exit = True
-
-            if now - start > 75:
+        if now - start > CAPTURE_HARD_TIMEOUT:
+            break
+
+        rlist, _, _ = select.select([master_fd], [], [], 0.2)
+        if master_fd in rlist:
+            try:
+                chunk = os.read(master_fd, 4096)
+            except OSError:
+                break
+            if not chunk:
                 break
+            output.append(chunk)
+            recent = strip_ansi(chunk.decode(errors="ignore"))
+            if "❯" in recent:
+                saw_prompt = True
+            if "Settings:" in recent:
+                saw_settings = True
+            if "Do you want to work in this folder?" in recent or "Yes, continue" in recent:
+                saw_folder_confirm = True
+            recent_lower = recent.lower()
+            if sent_folder_confirm and ("welcome back" in recent_lower or "try \"" in recent_lower):
+                saw_folder_confirm = False
+            if "try \"" in recent_lower or "for shortcuts" in recent_lower:
+                saw_prompt = True
+            if "current session" in recent_lower:
+                saw_usage = True
+                if not saw_usage_at:
+                    saw_usage_at = now
+            if "reset" in recent_lower:
+                saw_reset_line = True
+            if "/usage" in recent_lower:
+                saw_status_hint = True
+            if "/status         Show Claude Code status" in recent:
+                saw_status_hint = True
+            if "/stats                       Show your Claude Code usage statistics" in recent:
+                saw_stats_hint = True
+
+        if proc.poll() is not None:
+            break
+
+
+def boot_session(master_fd: int, proc: subprocess.Popen, output: List[bytes], timeout: float = WARM_BOOT_TIMEOUT) -> bool:
+    """Bring a fresh `claude` session to an idle `❯` prompt.
+
+    Accepts the "Do you want to work in this folder?" confirmation the same
+    way `drive_capture` does. Returns False if the prompt never settles.
+    """
+    start = time.time()
+    prompt_at = 0.0
+    saw_folder_confirm = False
+    sent_folder_confirm_at = 0.0
+    folder_confirm_attempts = 0
+    while True:
+        now = time.time()
+        if now - start > timeout or proc.poll() is not None:
+            return False
+        if saw_folder_confirm and now - sent_folder_confirm_at > 2.0:
+            if folder_confirm_attempts >= 3:
+                return False
+            time.sleep(0.3)
+            os.write(master_fd, b"\r")  # Enter로 "Yes, continue" 선택
+            sent_folder_confirm_at = now
+            folder_confirm_attempts += 1
+        # 프롬프트가 뜬 뒤 3초간 안정화 (콜드 캡처와 동일한 대기)
+        if prompt_at and not saw_folder_confirm and now - prompt_at > 3:
+            return True
+
+        rlist, _, _ = select.select([master_fd], [], [], 0.2)
+        if master_fd in rlist:
+            try:
+                chunk = os.read(master_fd, 4096)
+            except OSError:
+                return False
+            if not chunk:
+                return False
+            output.append(chunk)
+            recent = strip_ansi(chunk.decode(errors="ignore"))
+            recent_lower = recent.lower()
+            confirm_screen = "Do you want to work in this folder?" in recent or "Yes, continue" in recent
+            if confirm_screen:
+                saw_folder_confirm = True
+                prompt_at = 0.0
+            if folder_confirm_attempts and ("welcome back" in recent_lower or "try \"" in recent_lower):
+                saw_folder_confirm = False
+                # 확인 화면의 "❯ 1. Yes, continue"로 잡힌 시각은 무효, 실제 프롬프트부터 다시 측정
+                prompt_at = 0.0
+            # 확인 화면에도 ❯ 커서가 있으므로 해당 청크는 프롬프트로 보지 않음
+            if not confirm_screen and ("❯" in recent or "try \"" in recent_lower or "for shortcuts" in recent_lower):
+                if not prompt_at:
+                    prompt_at = now
+
+
+def serve_warm_session(socket_path: str, idle_timeout: float) -> int:
+    """Boot `claude` ahead of time and hand it to the next capture over a Unix socket.
+
+    The socket is bound before booting so a capture that arrives early waits
+    for the prompt instead of cold-starting a second CLI. One session serves
+    one capture; if none arrives within `idle_timeout` seconds of the prompt
+    settling, the session is torn down. Ownership of the socket is held with
+    an `flock` on `<socket_path>.lock` until the session is claimed, so a
+    second `--prewarm` can detect a live daemon without connecting to it.
+    """
+    lock_file = open(socket_path + ".lock", "w")
+    try:
+        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        # 이미 다른 워밍 세션이 소켓을 소유 중
+        lock_file.close()
+        return 0
+    # 잠금을 얻었으면 남아 있는 소켓은 죽은 데몬의 잔재
+    try:
+        os.unlink(socket_path)
+    except OSError:
+        pass
 
-            rlist, _, _ = select.select([master_fd], [], [], 0.2)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    server.listen(1)
+    owns_socket = True
+    master_fd, proc = spawn_claude()
+    output: List[bytes] = []
+    try:
+        if not boot_session(master_fd, proc, output):
+            return 1
+        deadline = time.time() + idle_timeout
+        while True:
+            remaining = deadline - time.time()
+            if remaining <= 0 or proc.poll() is not None:
+                return 0
+            rlist, _, _ = select.select([server, master_fd], [], [], min(remaining, 1.0))
             if master_fd in rlist:
+                # 대기 중에도 PTY 버퍼가 차지 않도록 계속 읽어둔다
                 try:
                     chunk = os.read(master_fd, 4096)
                 except OSError:
-                    break
+                    return 1
                 if not chunk:
-                    break
+                    return 1
                 output.append(chunk)
-                recent = strip_ansi(chunk.decode(errors="ignore"))
-                if "❯" in recent:
-                    saw_prompt = True
-                if "Settings:" in recent:
-                    saw_settings = True
-                if "Do you want to work in this folder?" in recent or "Yes, continue" in recent:
-                    saw_folder_confirm = True
-                recent_lower = recent.lower()
-                if sent_folder_confirm and ("welcome back" in recent_lower or "try \"" in recent_lower):
-                    saw_folder_confirm = False
-                if "try \"" in recent_lower or "for shortcuts" in recent_lower:
-                    saw_prompt = True
-                if "current session" in recent_lower:
-                    saw_usage = True
-                    if not saw_usage_at:
-                        saw_usage_at = now
-                if "reset" in recent_lower:
-                    saw_reset_line = True
-                if "/usage" in recent_lower:
-                    saw_status_hint = True
-                if "/status         Show Claude Code status" in recent:
-                    saw_status_hint = True
-                if "/stats                       Show your Claude Code usage statistics" in recent:
-                    saw_stats_hint = True
-
-            if proc.poll() is not None:
+            if server in rlist:
+                conn, _ = server.accept()
+                # 다른 클라이언트가 같은 세션을 받지 않도록 즉시 소켓 제거 후,
+                # 다음 --prewarm이 새 세션을 띄울 수 있게 잠금 해제
+                server.close()
+                os.unlink(socket_path)
+                owns_socket = False
+                lock_file.close()
+                with conn:
+                    drive_capture(master_fd, proc, output, ready=True)
+                    try:
+                        conn.sendall(b"".join(output))
+                    except OSError:
+                        pass
+                return 0
+    finally:
+        close_claude(master_fd, proc)
+        server.close()
+        if owns_socket:
+            try:
+                os.unlink(socket_path)
+            except OSError:
+                pass
+        lock_file.close()
+
+
+def capture_from_warm_session(socket_path: str, timeout: float = WARM_BOOT_TIMEOUT + CAPTURE_HARD_TIMEOUT + 15.0) -> Optional[bytes]:
+    """Run the capture on a pre-warmed session, or return None if none is available.
+
+    The default timeout covers a session that is still booting plus a full
+    capture, so a slow warm session is never raced by a cold fallback.
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(timeout)
+    chunks = []
+    try:
+        client.connect(socket_path)
+        while True:
+            chunk = client.recv(65536)
+            if not chunk:
                 break
+            chunks.append(chunk)
+    except OSError:
+        return None
     finally:
-        try:
-            os.close(master_fd)
-        except OSError:
-            pass
-        if proc.poll() is None:
-            proc.send_signal(signal.SIGTERM)
-
-    raw = b"".join(output).decode(errors="ignore")
-    clean = strip_ansi(raw)
-
-    if args.raw:
-        try:
-            with open(args.raw, "w", encoding="utf-8") as f:
-                f.write(clean)
-        except OSError:
-            pass
+        client.close()
+    return b"".join(chunks) or None
+
+
+def daemonize() -> bool:
+    """Detach into the background; returns True in the detached child."""
+    if os.fork() > 0:
+        return False
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    for fd in (0, 1, 2):
+        os.dup2(devnull, fd)
+    os.close(devnull)
+    return True
+
+
+def parse_status(clean: str) -> Tuple[List[str], dict, List[str]]:
+    """Parse ANSI-stripped `/status` output.
+
+    Returns (deduplicated `<section>: Resets ...` lines, usage percents by
+    section, non-empty output lines). An empty summary means parse failure.
+    """
     lines = [line.strip() for line in clean.splitlines() if line.strip()]
 
     def normalize_reset_text(text: str) -> Optional[str]:
@@ -298,15 +620,20 @@ def main() -> int:
         if percent is not None:
             percents["current_session"] = percent
 
+    seen = set()
+    deduped = []
+    for item in summary:
+        if item in seen:
+            continue
+        seen.add(item)
+        deduped.append(item)
+    return deduped, percents, lines
+
+
+def render_status(summary: List[str], percents: dict, lines: List[str], as_json: bool, extra: Optional[dict] = None) -> str:
+    """Format a `parse_status` result as JSON or text output."""
     if summary:
-        seen = set()
-        deduped = []
-        for item in summary:
-            if item in seen:
-                continue
-            seen.add(item)
-            deduped.append(item)
-        if args.json:
+        if as_json:
             payload = {
                 "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
                 "current_session_reset": None,
@@ -315,27 +642,119 @@ def main() -> int:
                 "current_week_sonnet_reset": None,
                 "source": "status_ui",
             }
-            for item in deduped:
+            payload.update(extra or {})
+            for item in summary:
                 if item.startswith("current_session:"):
                     payload["current_session_reset"] = item.split(":", 1)[1].strip()
                 elif item.startswith("current_week_all:"):
                     payload["current_week_all_reset"] = item.split(":", 1)[1].strip()
                 elif item.startswith("current_week_sonnet:"):
                     payload["current_week_sonnet_reset"] = item.split(":", 1)[1].strip()
-            print(json.dumps(payload, ensure_ascii=True))
-        else:
-            print("\n".join(deduped))
-    else:
-        if args.json:
-            payload = {
-                "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                "error": "parse_failed",
-                "raw_tail": lines[-10:],
-                "source": "status_ui",
-            }
-            print(json.dumps(payload, ensure_ascii=True))
-        else:
-            print("\n".join(lines[-20:]))
+            return json.dumps(payload, ensure_ascii=True)
+        return "\n".join(summary)
+    if as_json:
+        payload = {
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "error": "parse_failed",
+            "raw_tail": lines[-10:],
+            "source": "status_ui",
+        }
+        payload.update(extra or {})
+        return json.dumps(payload, ensure_ascii=True)
+    return "\n".join(lines[-20:])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--json", action="store_true", help="output JSON summary")
+    parser.add_argument("--raw", type=str, help="write raw output to file")
+    parser.add_argument("--raw-archive", type=str, help="append compressed raw output to archive directory")
+    parser.add_argument("--extract", type=str, metavar="OUT_DIR", help="extract captures from --raw-archive into OUT_DIR and exit")
+    parser.add_argument("--outcome", type=str, choices=["ok", "parse_failed"], help="only extract captures with this parse outcome")
+    parser.add_argument("--parse-file", type=str, nargs="+", metavar="FILE", help="parse saved raw output (e.g. extracted captures) instead of running claude")
+    parser.add_argument("--warm-socket", type=str, help="use (or with --prewarm, serve) a pre-warmed session on this Unix socket")
+    parser.add_argument("--prewarm", action="store_true", help="boot a session in the background and serve it on --warm-socket")
+    parser.add_argument("--idle-timeout", type=float, default=60.0, help="seconds an unused pre-warmed session stays alive (default 60)")
+    args = parser.parse_args()
+
+    if args.prewarm:
+        if not args.warm_socket:
+            parser.error("--prewarm requires --warm-socket")
+        if not daemonize():
+            return 0
+        try:
+            code = serve_warm_session(args.warm_socket, args.idle_timeout)
+        except Exception:
+            code = 1
+        os._exit(code)
+
+    if args.outcome and not args.extract:
+        parser.error("--outcome requires --extract")
+
+    if args.parse_file:
+        # 추출한 캡처를 일괄 재파싱 (파서 회귀 확인용)
+        code = 0
+        for path in args.parse_file:
+            try:
+                with open(path, encoding="utf-8", errors="ignore") as f:
+                    clean = strip_ansi(f.read())
+            except OSError as exc:
+                print(f"{path}: {exc}", file=sys.stderr)
+                code = 1
+                continue
+            summary, percents, lines = parse_status(clean)
+            if args.json:
+                print(render_status(summary, percents, lines, True, {"file": path}))
+            else:
+                print(f"== {path}")
+                print(render_status(summary, percents, lines, False))
+        return code
+
+    if args.extract:
+        if not args.raw_archive:
+            parser.error("--extract requires --raw-archive")
+        count, skipped = extract_archive(args.raw_archive, args.extract, args.outcome)
+        print(f"extracted {count} capture(s) to {args.extract}")
+        if skipped:
+            print(f"skipped {skipped} capture(s): incomplete index entry, or dictionary/data missing or corrupt", file=sys.stderr)
+            return 1
+        return 0
+
+    raw_bytes = None
+    if args.warm_socket:
+        raw_bytes = capture_from_warm_session(args.warm_socket)
+    if raw_bytes is None:
+        output: List[bytes] = []
+        master_fd, proc = spawn_claude()
+        try:
+            drive_capture(master_fd, proc, output)
+        finally:
+            close_claude(master_fd, proc)
+        raw_bytes = b"".join(output)
+
+    raw = raw_bytes.decode(errors="ignore")
+    clean = strip_ansi(raw)
+
+    if args.raw:
+        try:
+            with open(args.raw, "w", encoding="utf-8") as f:
+                f.write(clean)
+        except OSError:
+            pass
+    summary, percents, lines = parse_status(clean)
+
+    if args.raw_archive:
+        try:
+            archive_capture(
+                args.raw_archive,
+                clean,
+                time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "ok" if summary else "parse_failed",
+            )
+        except OSError:
+            pass
+
+    print(render_status(summary, percents, lines, args.json))
     return 0
 
 